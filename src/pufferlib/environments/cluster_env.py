@@ -21,19 +21,77 @@ Rewards:
 
 import gymnasium as gym
 from gymnasium import spaces
+from gymnasium.vector.utils import batch_space
 import numpy as np
-import subprocess
-import json
-from typing import Dict, List, Any, Optional, Tuple
-from dataclasses import dataclass
-from enum import IntEnum
+import random
+import threading
+import time
+from collections import Counter
+from typing import TYPE_CHECKING, Dict, List, Any, Literal, Optional, Tuple
+from enum import IntEnum, IntFlag
+
+if TYPE_CHECKING:
+    from concurrent.futures import ThreadPoolExecutor
+
+# Modules only needed for real clusters or PufferLib (subprocess, json,
+# orjson, kubernetes, pufferlib) are imported on first use, so simulation
+# workers do not pay for them at startup.
+
+# pufferlib.emulation once make() has tried to import it; False if missing
+_pufferlib_emulation = None
+
+
+def _get_pufferlib_emulation():
+    """Import pufferlib.emulation on first use, caching the result"""
+    global _pufferlib_emulation
+    if _pufferlib_emulation is None:
+        try:
+            import pufferlib.emulation
+            _pufferlib_emulation = pufferlib.emulation
+        except ImportError:
+            _pufferlib_emulation = False
+    return _pufferlib_emulation
+
+
+# JSON parser for kubectl output, chosen on first use
+_json_loads = None
+
+
+def _load_json(data):
+    """Parse kubectl JSON output (bytes), with orjson when it is installed"""
+    global _json_loads
+    if _json_loads is None:
+        try:
+            import orjson
+            _json_loads = orjson.loads
+        except ImportError:
+            import json
+            _json_loads = json.loads
+    return _json_loads(data)
+
 
 try:
-    import pufferlib
-    import pufferlib.emulation
-    PUFFERLIB_AVAILABLE = True
+    import numba
+    NUMBA_AVAILABLE = True
 except ImportError:
-    PUFFERLIB_AVAILABLE = False
+    NUMBA_AVAILABLE = False
+
+
+def _njit(fn):
+    """Compile a numeric kernel with Numba when it is installed"""
+    if NUMBA_AVAILABLE:
+        return numba.njit(cache=True, fastmath=True)(fn)
+    return fn
+
+
+def _njit_parallel(fn):
+    """Like _njit, but run ``_prange`` loops across all cores"""
+    if NUMBA_AVAILABLE:
+        return numba.njit(cache=True, fastmath=True, parallel=True)(fn)
+    return fn
+
+
+_prange = numba.prange if NUMBA_AVAILABLE else range
 
 
 class ClusterAction(IntEnum):
@@ -62,60 +120,482 @@ class ClusterAction(IntEnum):
     WAIT = 14
 
 
-@dataclass
-class ClusterState:
-    """Represents the current state of the cluster"""
-    num_nodes: int
-    nodes_ready: int
-    nodes_not_ready: int
-    
-    num_pods: int
-    pods_running: int
-    pods_pending: int
-    pods_failed: int
-    pods_unknown: int
-    
-    num_deployments: int
-    deployments_available: int
-    deployments_unavailable: int
-    
-    cpu_usage_percent: float
-    memory_usage_percent: float
-    
-    recent_events_warning: int
-    recent_events_normal: int
-    
-    has_pvc_issues: bool
-    has_network_issues: bool
-    has_resource_pressure: bool
-    
-    def to_observation(self) -> np.ndarray:
-        """Convert state to observation vector"""
-        return np.array([
-            self.num_nodes / 100.0,
-            self.nodes_ready / max(self.num_nodes, 1),
-            self.nodes_not_ready / max(self.num_nodes, 1),
-            
-            self.num_pods / 1000.0,
-            self.pods_running / max(self.num_pods, 1),
-            self.pods_pending / max(self.num_pods, 1),
-            self.pods_failed / max(self.num_pods, 1),
-            self.pods_unknown / max(self.num_pods, 1),
-            
-            self.num_deployments / 100.0,
-            self.deployments_available / max(self.num_deployments, 1),
-            self.deployments_unavailable / max(self.num_deployments, 1),
-            
-            self.cpu_usage_percent / 100.0,
-            self.memory_usage_percent / 100.0,
-            
-            min(self.recent_events_warning / 100.0, 1.0),
-            min(self.recent_events_normal / 100.0, 1.0),
-            
-            float(self.has_pvc_issues),
-            float(self.has_network_issues),
-            float(self.has_resource_pressure),
-        ], dtype=np.float32)
+# kubectl queries used to build the real cluster state
+KUBECTL_STATE_QUERIES = {
+    "nodes": ["get", "nodes", "-o", "json"],
+    "pods": ["get", "pods", "--all-namespaces", "-o", "json"],
+    "deployments": ["get", "deployments", "--all-namespaces", "-o", "json"],
+    "events": ["get", "events", "--all-namespaces", "-o", "json"],
+}
+
+# Recent kubectl results shared by all envs in the process,
+# keyed by (context, namespace) -> (fetch time, data)
+_cluster_data_cache: Dict[Tuple[Optional[str], str], Tuple[float, Dict[str, Dict]]] = {}
+
+# Bits of ClusterEnv._issue_mask, recomputed whenever the state is refreshed
+_ISSUE_NODES_NOT_READY = 1 << 0
+_ISSUE_PODS_FAILED = 1 << 1
+_ISSUE_PODS_PENDING = 1 << 2
+_ISSUE_PVC = 1 << 3
+_ISSUE_NETWORK = 1 << 4
+_ISSUE_RESOURCE_PRESSURE = 1 << 5
+_ISSUE_NO_READY_NODES = 1 << 6
+
+# Issues that must all be resolved for an episode to end successfully
+_RESOLVABLE_ISSUES = (
+    _ISSUE_NODES_NOT_READY | _ISSUE_PODS_FAILED | _ISSUE_PVC | _ISSUE_NETWORK | _ISSUE_RESOURCE_PRESSURE
+)
+
+# (bit, state field, message) reported by ClusterEnv._get_current_issues
+_ISSUE_MESSAGES = (
+    (_ISSUE_NODES_NOT_READY, "nodes_not_ready", "{} node(s) not ready"),
+    (_ISSUE_PODS_FAILED, "pods_failed", "{} pod(s) failed"),
+    (_ISSUE_PODS_PENDING, "pods_pending", "{} pod(s) pending"),
+    (_ISSUE_RESOURCE_PRESSURE, None, "Resource pressure detected"),
+)
+
+
+def _issue_mask(
+    nodes_ready: int,
+    nodes_not_ready: int,
+    pods_failed: int,
+    pods_pending: int,
+    has_pvc_issues: bool,
+    has_network_issues: bool,
+    has_resource_pressure: bool,
+) -> int:
+    """Pack the issue flags of a cluster state into an int bitmask"""
+    return (
+        (nodes_not_ready > 0) * _ISSUE_NODES_NOT_READY
+        | (pods_failed > 0) * _ISSUE_PODS_FAILED
+        | (pods_pending > 0) * _ISSUE_PODS_PENDING
+        | has_pvc_issues * _ISSUE_PVC
+        | has_network_issues * _ISSUE_NETWORK
+        | has_resource_pressure * _ISSUE_RESOURCE_PRESSURE
+        | (nodes_ready == 0) * _ISSUE_NO_READY_NODES
+    )
+
+
+def _episode_done(mask: int) -> bool:
+    """Whether an _ISSUE_* mask ends the episode: all issues resolved or no ready nodes"""
+    return not (mask & _RESOLVABLE_ISSUES) or bool(mask & _ISSUE_NO_READY_NODES)
+
+
+# Simulated issues and the probability each is injected on reset
+SIM_ISSUES = ("pod_failure", "node_not_ready", "resource_pressure", "pvc_issue", "network_issue")
+SIM_ISSUE_PROBS = np.array([0.3, 0.2, 0.2, 0.1, 0.1])
+
+
+class Issue(IntFlag):
+    """Simulated cluster issues; bit ``i`` corresponds to ``SIM_ISSUES[i]``"""
+    POD_FAILURE = 1
+    NODE_NOT_READY = 2
+    RESOURCE_PRESSURE = 4
+    PVC = 8
+    NETWORK = 16
+
+
+# Plain-int copies of the Issue bits for the hot path, where IntFlag
+# arithmetic would be far slower than int arithmetic
+_POD_FAILURE = int(Issue.POD_FAILURE)
+_NODE_NOT_READY = int(Issue.NODE_NOT_READY)
+_RESOURCE_PRESSURE = int(Issue.RESOURCE_PRESSURE)
+_PVC = int(Issue.PVC)
+_NETWORK = int(Issue.NETWORK)
+
+# SIM_ISSUE_PROBS as Python floats, compared against scalar draws
+_SIM_ISSUE_THRESHOLDS = tuple(SIM_ISSUE_PROBS.tolist())
+
+# Issue names for every possible simulated issue mask
+_SIM_ISSUE_NAMES = tuple(
+    tuple(name for i, name in enumerate(SIM_ISSUES) if mask >> i & 1)
+    for mask in range(1 << len(SIM_ISSUES))
+)
+
+
+# Cluster state record. A single environment holds one zero-dimensional
+# record of this dtype; fields are read and written in place.
+STATE_DTYPE = np.dtype([
+    ('num_nodes', 'i4'),
+    ('nodes_ready', 'i4'),
+    ('nodes_not_ready', 'i4'),
+
+    ('num_pods', 'i4'),
+    ('pods_running', 'i4'),
+    ('pods_pending', 'i4'),
+    ('pods_failed', 'i4'),
+    ('pods_unknown', 'i4'),
+
+    ('num_deployments', 'i4'),
+    ('deployments_available', 'i4'),
+    ('deployments_unavailable', 'i4'),
+
+    ('cpu_usage_percent', 'f4'),
+    ('memory_usage_percent', 'f4'),
+
+    ('recent_events_warning', 'i4'),
+    ('recent_events_normal', 'i4'),
+
+    ('has_pvc_issues', '?'),
+    ('has_network_issues', '?'),
+    ('has_resource_pressure', '?'),
+], align=True)
+
+
+def _write_simulated_state(s: np.ndarray, issues: int) -> int:
+    """Write the simulated state for an issue mask into ``s``, returning its _ISSUE_* mask"""
+    nodes_not_ready = 1 if issues & _NODE_NOT_READY else 0
+    pods_failed = 5 if issues & _POD_FAILURE else 0
+    resource_pressure = bool(issues & _RESOURCE_PRESSURE)
+    pods_pending = 3 if resource_pressure else 0
+    pvc_issue = bool(issues & _PVC)
+    network_issue = bool(issues & _NETWORK)
+
+    # Base healthy state
+    s['num_nodes'] = 5
+    s['num_pods'] = 50
+    s['num_deployments'] = 10
+
+    s['nodes_not_ready'] = nodes_not_ready
+    s['pods_failed'] = pods_failed
+    s['pods_pending'] = pods_pending
+
+    s['nodes_ready'] = 5 - nodes_not_ready
+    s['pods_running'] = 50 - pods_failed - pods_pending
+    s['pods_unknown'] = 0
+    s['deployments_unavailable'] = 1 if pods_failed > 0 else 0
+    s['deployments_available'] = 10 - (1 if pods_failed > 0 else 0)
+    s['cpu_usage_percent'] = 80.0 if resource_pressure else 40.0
+    s['memory_usage_percent'] = 75.0 if resource_pressure else 35.0
+    s['recent_events_warning'] = 10 if issues else 2
+    s['recent_events_normal'] = 20
+    s['has_pvc_issues'] = pvc_issue
+    s['has_network_issues'] = network_issue
+    s['has_resource_pressure'] = resource_pressure
+
+    return _issue_mask(
+        5 - nodes_not_ready, nodes_not_ready, pods_failed, pods_pending,
+        pvc_issue, network_issue, resource_pressure,
+    )
+
+
+# Simulated state record and _ISSUE_* mask for every possible simulated
+# issue mask, so a simulated state update is a single record copy
+_SIM_STATES = np.zeros(1 << len(SIM_ISSUES), dtype=STATE_DTYPE)
+_SIM_STATE_ISSUES = tuple(
+    _write_simulated_state(_SIM_STATES[mask, ...], mask)
+    for mask in range(1 << len(SIM_ISSUES))
+)
+
+
+# Observation features in output order: (state field, scale, clip to 1.0).
+# A float scale multiplies the field; a field-name scale divides by that
+# count (treated as at least 1); None passes the flag through as is.
+OBS_FEATURES = (
+    ('num_nodes', 0.01, False),
+    ('nodes_ready', 'num_nodes', False),
+    ('nodes_not_ready', 'num_nodes', False),
+
+    ('num_pods', 0.001, False),
+    ('pods_running', 'num_pods', False),
+    ('pods_pending', 'num_pods', False),
+    ('pods_failed', 'num_pods', False),
+    ('pods_unknown', 'num_pods', False),
+
+    ('num_deployments', 0.01, False),
+    ('deployments_available', 'num_deployments', False),
+    ('deployments_unavailable', 'num_deployments', False),
+
+    ('cpu_usage_percent', 0.01, False),
+    ('memory_usage_percent', 0.01, False),
+
+    ('recent_events_warning', 0.01, True),
+    ('recent_events_normal', 0.01, True),
+
+    ('has_pvc_issues', None, False),
+    ('has_network_issues', None, False),
+    ('has_resource_pressure', None, False),
+)
+
+
+def _build_obs_kernel(quantize: bool = False):
+    """
+    Generate the straight-line observation kernel from OBS_FEATURES.
+
+    Constants are folded into the source and each count's reciprocal is
+    computed once. The Numba build reads record fields by name; the
+    pure-Python build unpacks the record into locals with one ``item()``
+    call and stores all features with one slice assignment.
+
+    With ``quantize``, the kernel writes a uint8 vector instead: each float
+    feature, computed exactly as above, is stored as ``round(x * 255)``
+    (halves rounded up), clipped to 255.
+    """
+    if NUMBA_AVAILABLE:
+        lines = ["    s = state[()]"]
+        lines += [f"    {name} = s['{name}']" for name in STATE_DTYPE.names]
+    else:
+        lines = [f"    ({', '.join(STATE_DTYPE.names)},) = state.item()"]
+
+    exprs = []
+    inverses = set()
+    for name, scale, clip in OBS_FEATURES:
+        if scale is None:
+            exprs.append(f"{name} * 255" if quantize else name)
+            continue
+        if isinstance(scale, str):
+            if scale not in inverses:
+                inverses.add(scale)
+                lines.append(f"    inv_{scale} = 1.0 / ({scale} if {scale} > 1 else 1)")
+            expr = f"{name} * inv_{scale}"
+        else:
+            expr = f"{name} * {scale!r}"
+        if clip:
+            lines.append(f"    {name}_obs = {expr}")
+            expr = f"{name}_obs if {name}_obs < 1.0 else 1.0"
+        if quantize:
+            # Round half up; uint8 stores truncate the clipped value
+            lines.append(f"    {name}_q = ({expr}) * 255.0 + 0.5")
+            expr = f"{name}_q if {name}_q < 255.0 else 255.0"
+        exprs.append(expr)
+
+    if NUMBA_AVAILABLE:
+        lines += [f"    out[{i}] = {expr}" for i, expr in enumerate(exprs)]
+    else:
+        lines.append("    out[:] = (")
+        lines += [f"        {expr}," for expr in exprs]
+        lines.append("    )")
+
+    source = "def _obs_kernel(state, out):\n" + "\n".join(lines) + "\n"
+    namespace: Dict[str, Any] = {}
+    exec(compile(source, "<cluster_env._obs_kernel>", "exec"), namespace)
+    kernel = namespace["_obs_kernel"]
+    kernel.__doc__ = "Write the observation vector for a STATE_DTYPE record into ``out``"
+    if NUMBA_AVAILABLE:
+        # Generated source has no file for Numba's on-disk cache. No
+        # fastmath: reassociating the uint8 scaling would change rounding.
+        kernel = numba.njit(kernel)
+    return kernel
+
+
+_obs_kernel = _build_obs_kernel()
+_obs_kernel_uint8 = _build_obs_kernel(quantize=True)
+
+_OBS_DTYPES = (np.dtype(np.float32), np.dtype(np.uint8))
+
+
+def _observation_box(obs_dtype: np.dtype, dim: int) -> spaces.Box:
+    """Observation space for ``dim`` features stored as ``obs_dtype``"""
+    high = 255 if obs_dtype == np.uint8 else 1.0
+    return spaces.Box(low=0, high=high, shape=(dim,), dtype=obs_dtype)
+
+
+@_njit
+def _reward_kernel(prev_state, curr_state):
+    """Reward for the transition between two STATE_DTYPE records"""
+    prev = prev_state[()]
+    curr = curr_state[()]
+    d_failed = prev['pods_failed'] - curr['pods_failed']
+    d_pending = prev['pods_pending'] - curr['pods_pending']
+    d_not_ready = prev['nodes_not_ready'] - curr['nodes_not_ready']
+
+    # Reward for improving cluster health, penalty for degradation
+    reward = (
+        10.0 * max(d_failed, 0) - 15.0 * max(-d_failed, 0)
+        + 5.0 * max(d_pending, 0)
+        + 20.0 * max(d_not_ready, 0) - 25.0 * max(-d_not_ready, 0)
+    )
+
+    # Reward for resource optimization
+    reward += 2.0 * ((curr['cpu_usage_percent'] < prev['cpu_usage_percent'])
+                     & (prev['cpu_usage_percent'] > 70))
+
+    # Small penalty for each step (encourage efficiency)
+    reward -= 0.1
+
+    # Bonus for fully healthy cluster
+    reward += 5.0 * ((curr['pods_failed'] == 0)
+                     & (curr['nodes_not_ready'] == 0)
+                     & (curr['pods_pending'] == 0))
+
+    return reward
+
+
+def _node_ready(node) -> bool:
+    """Whether a V1Node reports Ready=True"""
+    conditions = node.status.conditions if node.status else None
+    return any(c.type == "Ready" and c.status == "True" for c in conditions or ())
+
+
+def _pod_phase(pod) -> Optional[str]:
+    """Phase of a V1Pod"""
+    return pod.status.phase if pod.status else None
+
+
+def _deployment_available(deployment) -> bool:
+    """Whether a V1Deployment has all desired replicas available"""
+    available = (deployment.status.available_replicas if deployment.status else None) or 0
+    wanted = deployment.spec.replicas if deployment.spec and deployment.spec.replicas is not None else 1
+    return available >= wanted
+
+
+def _event_type(event) -> Optional[str]:
+    """Type (Normal/Warning) of a CoreV1Event"""
+    return event.type
+
+
+class _ClusterWatcher:
+    """
+    Live summary of a cluster's nodes, pods, deployments and events
+
+    Each resource is listed once and then followed with a long-running watch
+    in a daemon thread. Only one summary value per object (pod phase, node
+    readiness, ...) is kept, together with running counts of those values,
+    so reading the cluster state needs no API round trip. A kind that cannot
+    be listed (e.g. forbidden by RBAC) counts as empty, like a failed kubectl
+    query, and is retried with exponential backoff.
+    """
+
+    # Seconds after startup to wait for the initial listings before giving up
+    SYNC_TIMEOUT = 30.0
+    # Server-side timeout of a single watch request
+    WATCH_TIMEOUT = 300
+    # Initial and maximum delay in seconds before relisting after an error
+    RELIST_BACKOFF = 1.0
+    RELIST_BACKOFF_MAX = 60.0
+
+    def __init__(self, context: Optional[str] = None):
+        from kubernetes import client as k8s_client, config as k8s_config, watch as k8s_watch
+        
+        api_client = k8s_config.new_client_from_config(context=context)
+        core = k8s_client.CoreV1Api(api_client)
+        apps = k8s_client.AppsV1Api(api_client)
+        self._watch_cls = k8s_watch.Watch
+
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._sync_deadline = time.monotonic() + self.SYNC_TIMEOUT
+        self._summaries: Dict[str, Dict[str, Any]] = {}
+        self._counts: Dict[str, Counter] = {}
+        self._synced: Dict[str, threading.Event] = {}
+        self._listed: Dict[str, bool] = {}
+        # Number of envs using this watcher (see _get_cluster_watcher)
+        self.users = 0
+
+        resources = {
+            "nodes": (core.list_node, _node_ready),
+            "pods": (core.list_pod_for_all_namespaces, _pod_phase),
+            "deployments": (apps.list_deployment_for_all_namespaces, _deployment_available),
+            "events": (core.list_event_for_all_namespaces, _event_type),
+        }
+        for kind, (list_fn, summarize) in resources.items():
+            self._summaries[kind] = {}
+            self._counts[kind] = Counter()
+            self._synced[kind] = threading.Event()
+            self._listed[kind] = False
+            threading.Thread(
+                target=self._follow,
+                args=(kind, list_fn, summarize),
+                name=f"cluster-watch-{kind}",
+                daemon=True,
+            ).start()
+
+    def snapshot(self) -> Dict[str, Counter]:
+        """Copy of the current summary counts for every resource kind
+
+        Blocks only until every kind has made its first listing attempt,
+        and at most until SYNC_TIMEOUT seconds after startup. Raises
+        TimeoutError if that deadline passes first, and ConnectionError if
+        no kind could be listed at all.
+        """
+        for kind, synced in self._synced.items():
+            if not synced.wait(max(self._sync_deadline - time.monotonic(), 0.0)):
+                raise TimeoutError(f"Timed out waiting for the initial {kind} listing")
+        with self._lock:
+            if not any(self._listed.values()):
+                raise ConnectionError("Could not list any cluster resources")
+            return {kind: counts.copy() for kind, counts in self._counts.items()}
+
+    def stop(self):
+        """Stop following the cluster after the current watch requests end"""
+        self._stopped.set()
+
+    def _follow(self, kind: str, list_fn, summarize):
+        """List ``kind`` and apply its watch events until stopped"""
+        backoff = self.RELIST_BACKOFF
+        while not self._stopped.is_set():
+            try:
+                listing = list_fn()
+                summaries = {item.metadata.uid: summarize(item) for item in listing.items}
+                with self._lock:
+                    self._summaries[kind] = summaries
+                    self._counts[kind] = Counter(summaries.values())
+                    self._listed[kind] = True
+                self._synced[kind].set()
+
+                stream = self._watch_cls().stream(
+                    list_fn,
+                    resource_version=listing.metadata.resource_version,
+                    timeout_seconds=self.WATCH_TIMEOUT,
+                )
+                for event in stream:
+                    if self._stopped.is_set():
+                        return
+                    self._apply(kind, event["type"], event["object"], summarize)
+                    backoff = self.RELIST_BACKOFF
+                # The watch ended cleanly at its server-side timeout. A
+                # successful listing alone does not reset the backoff, so a
+                # watch that always fails (e.g. list allowed but not watch
+                # by RBAC) still backs off.
+                backoff = self.RELIST_BACKOFF
+            except Exception:
+                # A kind whose first listing fails counts as empty. Relist
+                # after a failed listing, an expired resource version or a
+                # dropped connection.
+                self._synced[kind].set()
+                self._stopped.wait(backoff)
+                backoff = min(backoff * 2, self.RELIST_BACKOFF_MAX)
+
+    def _apply(self, kind: str, event_type: str, obj, summarize):
+        """Update the summary of ``kind`` for one watch event"""
+        if event_type == "ERROR":
+            raise RuntimeError(f"Watch on {kind} failed: {obj}")
+
+        uid = obj.metadata.uid
+        with self._lock:
+            summaries = self._summaries[kind]
+            counts = self._counts[kind]
+            if uid in summaries:
+                counts[summaries.pop(uid)] -= 1
+            if event_type != "DELETED":
+                value = summarize(obj)
+                summaries[uid] = value
+                counts[value] += 1
+
+
+# Watchers shared by all envs in the process, keyed by kube context
+_cluster_watchers: Dict[Optional[str], _ClusterWatcher] = {}
+_cluster_watchers_lock = threading.Lock()
+
+
+def _get_cluster_watcher(context: Optional[str]) -> _ClusterWatcher:
+    """Return the shared watcher for ``context``, starting it if needed"""
+    with _cluster_watchers_lock:
+        watcher = _cluster_watchers.get(context)
+        if watcher is None:
+            watcher = _cluster_watchers[context] = _ClusterWatcher(context)
+        watcher.users += 1
+        return watcher
+
+
+def _release_cluster_watcher(context: Optional[str], watcher: _ClusterWatcher):
+    """Drop one user of a watcher, stopping it once no env uses it"""
+    with _cluster_watchers_lock:
+        watcher.users -= 1
+        if watcher.users <= 0:
+            watcher.stop()
+            if _cluster_watchers.get(context) is watcher:
+                del _cluster_watchers[context]
 
 
 class ClusterEnv(gym.Env):
@@ -129,7 +609,7 @@ class ClusterEnv(gym.Env):
     metadata = {'render_modes': ['human', 'rgb_array']}
     
     # Observation space dimension
-    OBS_DIM = 18
+    OBS_DIM = len(OBS_FEATURES)
     # Number of actions
     NUM_ACTIONS = len(ClusterAction)
     
@@ -140,33 +620,72 @@ class ClusterEnv(gym.Env):
         simulation_mode: bool = True,
         max_steps: int = 100,
         render_mode: str = "human",
+        state_cache_ttl: float = 2.0,
+        use_kubernetes_client: bool = True,
+        info_mode: Literal["full", "minimal", "none"] = "full",
+        obs_dtype: Any = np.float32,
+        copy_obs: bool = True,
     ):
         super().__init__()
         
+        if info_mode not in ("full", "minimal", "none"):
+            raise ValueError(f"Unknown info_mode: {info_mode!r} (expected 'full', 'minimal' or 'none')")
+        obs_dtype = np.dtype(obs_dtype)
+        if obs_dtype not in _OBS_DTYPES:
+            raise ValueError(f"Unsupported obs_dtype: {obs_dtype} (expected float32 or uint8)")
+        
         self.context = context
         self.namespace = namespace
         self.simulation_mode = simulation_mode
         self.max_steps = max_steps
         self.render_mode = render_mode
+        self.state_cache_ttl = state_cache_ttl
+        self.use_kubernetes_client = use_kubernetes_client
+        self.info_mode = info_mode
+        self.obs_dtype = obs_dtype
+        self.copy_obs = copy_obs
+        
+        # Real cluster access: a shared watcher when the Kubernetes client is
+        # installed, otherwise kubectl run from a small worker pool
+        self._watcher: Optional[_ClusterWatcher] = None
+        self._kubectl_prefix = ["kubectl"]
+        if context:
+            self._kubectl_prefix.extend(["--context", context])
+        self._executor: Optional["ThreadPoolExecutor"] = None
         
         # Define spaces
-        self.observation_space = spaces.Box(
-            low=0.0,
-            high=1.0,
-            shape=(self.OBS_DIM,),
-            dtype=np.float32,
-        )
+        self.observation_space = _observation_box(obs_dtype, self.OBS_DIM)
         
         self.action_space = spaces.Discrete(self.NUM_ACTIONS)
         
         # Episode tracking
         self.current_step = 0
         self.total_reward = 0.0
-        self.state: Optional[ClusterState] = None
+        self.state = np.zeros((), dtype=STATE_DTYPE)
+        self._prev_state = np.zeros((), dtype=STATE_DTYPE)
+        self._issue_mask = 0
         self.action_history: List[int] = []
         
-        # Simulation state (for simulation mode)
-        self._sim_issues: List[str] = []
+        # Simulation state (for simulation mode): a mask of Issue bits, and
+        # a scalar RNG for issue draws seeded from np_random in reset()
+        self._sim_issues = 0
+        self._random: Optional[random.Random] = None
+
+        # Observation buffer, reused by every reset/step; callers get a copy
+        # unless copy_obs is False. The info dicts are reused (and cleared on
+        # each call, dropping keys added by wrappers) only when info_mode is
+        # not "full"; "full" returns a new dict.
+        self._obs_buf = np.zeros(self.OBS_DIM, dtype=obs_dtype)
+        self._obs_kernel = _obs_kernel_uint8 if obs_dtype == np.uint8 else _obs_kernel
+        self._reset_info: Dict[str, Any] = {}
+        self._step_info: Dict[str, Any] = {}
+
+        # Simulated remediation handlers, keyed by action value
+        self._sim_action_table = {
+            int(ClusterAction.RESTART_FAILED_PODS): self._sim_restart_failed_pods,
+            int(ClusterAction.UNCORDON_NODE): self._sim_uncordon_node,
+            int(ClusterAction.SCALE_DOWN_DEPLOYMENT): self._sim_scale_down_deployment,
+        }
         
     def reset(
         self,
@@ -175,6 +694,8 @@ class ClusterEnv(gym.Env):
     ) -> Tuple[np.ndarray, Dict]:
         """Reset the environment"""
         super().reset(seed=seed)
+        if seed is not None or self._random is None:
+            self._random = random.Random(int(self.np_random.integers(1 << 63)))
         
         self.current_step = 0
         self.total_reward = 0.0
@@ -183,27 +704,41 @@ class ClusterEnv(gym.Env):
         if self.simulation_mode:
             self._reset_simulation()
         
-        self.state = self._get_cluster_state()
-        obs = self.state.to_observation()
+        self._get_cluster_state(self.state)
+        self._obs_kernel(self.state, self._obs_buf)
         
-        info = {
-            "step": self.current_step,
-            "issues": self._get_current_issues(),
-        }
+        if self.info_mode == "full":
+            info = {}
+        else:
+            info = self._reset_info
+            info.clear()
+        if self.info_mode != "none":
+            info["step"] = self.current_step
+            if self.info_mode == "full":
+                info["issues"] = self._get_current_issues()
         
-        return obs, info
+        return self._obs_buf.copy() if self.copy_obs else self._obs_buf, info
     
     def step(self, action: int) -> Tuple[np.ndarray, float, bool, bool, Dict]:
         """Execute an action in the environment"""
+        action = int(action)
+        action_enum = ClusterAction(action)
         self.current_step += 1
         self.action_history.append(action)
         
         # Execute action
-        action_result = self._execute_action(ClusterAction(action))
+        sim_issues = self._sim_issues
+        action_result = self._execute_action(action_enum)
         
-        # Get new state
-        prev_state = self.state
-        self.state = self._get_cluster_state()
+        # Get new state. In simulation the state only depends on the issue
+        # mask, so actions that resolved nothing leave it unchanged.
+        if self.simulation_mode and self._sim_issues == sim_issues:
+            prev_state = self.state
+        else:
+            # Swap the records rather than copying; every field is rewritten
+            self._prev_state, self.state = self.state, self._prev_state
+            self._get_cluster_state(self.state)
+            prev_state = self._prev_state
         
         # Calculate reward
         reward = self._calculate_reward(prev_state, self.state, action, action_result)
@@ -213,25 +748,32 @@ class ClusterEnv(gym.Env):
         terminated = self._check_terminated()
         truncated = self.current_step >= self.max_steps
         
-        obs = self.state.to_observation()
-        info = {
-            "step": self.current_step,
-            "action": ClusterAction(action).name,
-            "action_result": action_result,
-            "total_reward": self.total_reward,
-            "issues": self._get_current_issues(),
-        }
+        self._obs_kernel(self.state, self._obs_buf)
+        if self.info_mode == "full":
+            info = {}
+        else:
+            info = self._step_info
+            info.clear()
+        if self.info_mode != "none":
+            info["step"] = self.current_step
+            info["action"] = action_enum.name
+            info["action_result"] = action_result
+            info["total_reward"] = self.total_reward
+            if self.info_mode == "full":
+                info["issues"] = self._get_current_issues()
         
+        obs = self._obs_buf.copy() if self.copy_obs else self._obs_buf
         return obs, reward, terminated, truncated, info
     
     def render(self):
         """Render the environment"""
-        if self.render_mode == "human" and self.state is not None:
+        if self.render_mode == "human":
+            s = self.state
             print(f"\n=== Cluster State (Step {self.current_step}) ===")
-            print(f"Nodes: {self.state.nodes_ready}/{self.state.num_nodes} ready")
-            print(f"Pods: {self.state.pods_running} running, {self.state.pods_pending} pending, {self.state.pods_failed} failed")
-            print(f"Deployments: {self.state.deployments_available}/{self.state.num_deployments} available")
-            print(f"Resources: CPU {self.state.cpu_usage_percent:.1f}%, Memory {self.state.memory_usage_percent:.1f}%")
+            print(f"Nodes: {s['nodes_ready']}/{s['num_nodes']} ready")
+            print(f"Pods: {s['pods_running']} running, {s['pods_pending']} pending, {s['pods_failed']} failed")
+            print(f"Deployments: {s['deployments_available']}/{s['num_deployments']} available")
+            print(f"Resources: CPU {s['cpu_usage_percent']:.1f}%, Memory {s['memory_usage_percent']:.1f}%")
             print(f"Total Reward: {self.total_reward:.2f}")
             if self.action_history:
                 last_action = ClusterAction(self.action_history[-1]).name
@@ -239,167 +781,172 @@ class ClusterEnv(gym.Env):
     
     def close(self):
         """Clean up resources"""
-        pass
+        if self._watcher is not None:
+            _release_cluster_watcher(self.context, self._watcher)
+            self._watcher = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
     
     def _reset_simulation(self):
         """Reset simulation state with random issues"""
-        self._sim_issues = []
-        
-        # Randomly introduce issues
-        if self.np_random.random() < 0.3:
-            self._sim_issues.append("pod_failure")
-        if self.np_random.random() < 0.2:
-            self._sim_issues.append("node_not_ready")
-        if self.np_random.random() < 0.2:
-            self._sim_issues.append("resource_pressure")
-        if self.np_random.random() < 0.1:
-            self._sim_issues.append("pvc_issue")
-        if self.np_random.random() < 0.1:
-            self._sim_issues.append("network_issue")
-    
-    def _get_cluster_state(self) -> ClusterState:
-        """Get current cluster state"""
+        # Randomly introduce issues. Scalar draws from random.Random avoid
+        # the per-call overhead of np_random, which only seeds it.
+        rand = self._random.random
+        p = _SIM_ISSUE_THRESHOLDS
+        issues = (
+            (rand() < p[0]) * _POD_FAILURE
+            | (rand() < p[1]) * _NODE_NOT_READY
+            | (rand() < p[2]) * _RESOURCE_PRESSURE
+            | (rand() < p[3]) * _PVC
+            | (rand() < p[4]) * _NETWORK
+        )
+        
+        self._sim_issues = issues
+    
+    def _get_cluster_state(self, state: np.ndarray) -> None:
+        """Write the current cluster state into ``state``"""
         if self.simulation_mode:
-            return self._get_simulated_state()
+            self._get_simulated_state(state)
         else:
-            return self._get_real_cluster_state()
-    
-    def _get_simulated_state(self) -> ClusterState:
-        """Generate simulated cluster state"""
-        # Base healthy state
-        num_nodes = 5
-        num_pods = 50
-        num_deployments = 10
-        
-        nodes_not_ready = 1 if "node_not_ready" in self._sim_issues else 0
-        pods_failed = 5 if "pod_failure" in self._sim_issues else 0
-        pods_pending = 3 if "resource_pressure" in self._sim_issues else 0
-        
-        return ClusterState(
-            num_nodes=num_nodes,
-            nodes_ready=num_nodes - nodes_not_ready,
-            nodes_not_ready=nodes_not_ready,
-            num_pods=num_pods,
-            pods_running=num_pods - pods_failed - pods_pending,
-            pods_pending=pods_pending,
-            pods_failed=pods_failed,
-            pods_unknown=0,
-            num_deployments=num_deployments,
-            deployments_available=num_deployments - (1 if pods_failed > 0 else 0),
-            deployments_unavailable=1 if pods_failed > 0 else 0,
-            cpu_usage_percent=80.0 if "resource_pressure" in self._sim_issues else 40.0,
-            memory_usage_percent=75.0 if "resource_pressure" in self._sim_issues else 35.0,
-            recent_events_warning=10 if self._sim_issues else 2,
-            recent_events_normal=20,
-            has_pvc_issues="pvc_issue" in self._sim_issues,
-            has_network_issues="network_issue" in self._sim_issues,
-            has_resource_pressure="resource_pressure" in self._sim_issues,
-        )
+            self._get_real_cluster_state(state)
+    
+    def _get_simulated_state(self, s: np.ndarray) -> None:
+        """Write the simulated cluster state into ``s``"""
+        issues = self._sim_issues
+        s[()] = _SIM_STATES[issues]
+        self._issue_mask = _SIM_STATE_ISSUES[issues]
     
-    def _get_real_cluster_state(self) -> ClusterState:
-        """Get state from real Kubernetes cluster"""
+    def _get_real_cluster_state(self, s: np.ndarray) -> None:
+        """Write the state of the real Kubernetes cluster into ``s``"""
         try:
-            # Build kubectl command prefix
-            kubectl_prefix = ["kubectl"]
-            if self.context:
-                kubectl_prefix.extend(["--context", self.context])
+            counts = self._get_cluster_counts()
             
-            # Get nodes
-            nodes_result = subprocess.run(
-                kubectl_prefix + ["get", "nodes", "-o", "json"],
-                capture_output=True,
-                text=True,
-                timeout=30,
-            )
-            nodes_data = json.loads(nodes_result.stdout) if nodes_result.returncode == 0 else {"items": []}
+            nodes = counts["nodes"]
+            num_nodes = sum(nodes.values())
+            nodes_ready = nodes[True]
             
-            # Get pods
-            pods_result = subprocess.run(
-                kubectl_prefix + ["get", "pods", "--all-namespaces", "-o", "json"],
-                capture_output=True,
-                text=True,
-                timeout=30,
-            )
-            pods_data = json.loads(pods_result.stdout) if pods_result.returncode == 0 else {"items": []}
-            
-            # Get deployments
-            deploy_result = subprocess.run(
-                kubectl_prefix + ["get", "deployments", "--all-namespaces", "-o", "json"],
-                capture_output=True,
-                text=True,
-                timeout=30,
-            )
-            deploy_data = json.loads(deploy_result.stdout) if deploy_result.returncode == 0 else {"items": []}
-            
-            # Parse node data
-            num_nodes = len(nodes_data.get("items", []))
-            nodes_ready = sum(
-                1 for node in nodes_data.get("items", [])
-                if any(
-                    cond.get("type") == "Ready" and cond.get("status") == "True"
-                    for cond in node.get("status", {}).get("conditions", [])
-                )
-            )
+            phases = counts["pods"]
+            num_pods = sum(phases.values())
+            pods_running = phases["Running"]
+            pods_pending = phases["Pending"]
+            pods_failed = phases["Failed"]
+            pods_unknown = phases["Unknown"]
             
-            # Parse pod data
-            pods = pods_data.get("items", [])
-            num_pods = len(pods)
-            pods_running = sum(1 for p in pods if p.get("status", {}).get("phase") == "Running")
-            pods_pending = sum(1 for p in pods if p.get("status", {}).get("phase") == "Pending")
-            pods_failed = sum(1 for p in pods if p.get("status", {}).get("phase") == "Failed")
-            pods_unknown = sum(1 for p in pods if p.get("status", {}).get("phase") == "Unknown")
+            deployments = counts["deployments"]
+            num_deployments = sum(deployments.values())
+            deployments_available = deployments[True]
             
-            # Parse deployment data
-            deployments = deploy_data.get("items", [])
-            num_deployments = len(deployments)
-            deployments_available = sum(
-                1 for d in deployments
-                if d.get("status", {}).get("availableReplicas", 0) >= d.get("spec", {}).get("replicas", 1)
-            )
+            events_warning = counts["events"]["Warning"]
+            events_normal = counts["events"]["Normal"]
             
-            # Get events
-            events_result = subprocess.run(
-                kubectl_prefix + ["get", "events", "--all-namespaces", "-o", "json"],
-                capture_output=True,
-                text=True,
-                timeout=30,
-            )
-            events_data = json.loads(events_result.stdout) if events_result.returncode == 0 else {"items": []}
-            events = events_data.get("items", [])
-            events_warning = sum(1 for e in events if e.get("type") == "Warning")
-            events_normal = sum(1 for e in events if e.get("type") == "Normal")
+            s['num_nodes'] = num_nodes
+            s['nodes_ready'] = nodes_ready
+            s['nodes_not_ready'] = num_nodes - nodes_ready
+            s['num_pods'] = num_pods
+            s['pods_running'] = pods_running
+            s['pods_pending'] = pods_pending
+            s['pods_failed'] = pods_failed
+            s['pods_unknown'] = pods_unknown
+            s['num_deployments'] = num_deployments
+            s['deployments_available'] = deployments_available
+            s['deployments_unavailable'] = num_deployments - deployments_available
+            s['cpu_usage_percent'] = 50.0  # Would need metrics-server for real values
+            s['memory_usage_percent'] = 50.0
+            s['recent_events_warning'] = events_warning
+            s['recent_events_normal'] = events_normal
+            s['has_pvc_issues'] = False  # Would need more detailed checks
+            s['has_network_issues'] = False
+            s['has_resource_pressure'] = pods_pending > 0
             
-            return ClusterState(
-                num_nodes=num_nodes,
-                nodes_ready=nodes_ready,
-                nodes_not_ready=num_nodes - nodes_ready,
-                num_pods=num_pods,
-                pods_running=pods_running,
-                pods_pending=pods_pending,
-                pods_failed=pods_failed,
-                pods_unknown=pods_unknown,
-                num_deployments=num_deployments,
-                deployments_available=deployments_available,
-                deployments_unavailable=num_deployments - deployments_available,
-                cpu_usage_percent=50.0,  # Would need metrics-server for real values
-                memory_usage_percent=50.0,
-                recent_events_warning=events_warning,
-                recent_events_normal=events_normal,
-                has_pvc_issues=False,  # Would need more detailed checks
-                has_network_issues=False,
-                has_resource_pressure=pods_pending > 0,
+            self._issue_mask = _issue_mask(
+                nodes_ready, num_nodes - nodes_ready, pods_failed, pods_pending,
+                False, False, pods_pending > 0,
             )
             
         except Exception as e:
             # Return empty state on error
-            return ClusterState(
-                num_nodes=0, nodes_ready=0, nodes_not_ready=0,
-                num_pods=0, pods_running=0, pods_pending=0, pods_failed=0, pods_unknown=0,
-                num_deployments=0, deployments_available=0, deployments_unavailable=0,
-                cpu_usage_percent=0, memory_usage_percent=0,
-                recent_events_warning=0, recent_events_normal=0,
-                has_pvc_issues=False, has_network_issues=False, has_resource_pressure=False,
+            s[...] = 0
+            self._issue_mask = _ISSUE_NO_READY_NODES
+    
+    def _get_cluster_counts(self) -> Dict[str, Counter]:
+        """Summary counts of nodes, pods, deployments and events
+        
+        ``nodes`` and ``deployments`` count readiness/availability booleans,
+        ``pods`` counts phases and ``events`` counts event types.
+        """
+        if self.use_kubernetes_client:
+            try:
+                if self._watcher is None:
+                    self._watcher = _get_cluster_watcher(self.context)
+                return self._watcher.snapshot()
+            except Exception:
+                # Client not installed, no usable kubeconfig or the initial
+                # sync failed; fall back to kubectl
+                self.use_kubernetes_client = False
+                if self._watcher is not None:
+                    _release_cluster_watcher(self.context, self._watcher)
+                    self._watcher = None
+        
+        return self._count_kubectl_data(self._fetch_cluster_data())
+    
+    @staticmethod
+    def _count_kubectl_data(data: Dict[str, Dict]) -> Dict[str, Counter]:
+        """Summary counts from parsed ``kubectl get -o json`` output"""
+        nodes = Counter(
+            any(
+                cond.get("type") == "Ready" and cond.get("status") == "True"
+                for cond in (node.get("status") or {}).get("conditions", [])
             )
+            for node in data["nodes"].get("items", [])
+        )
+        
+        phases = Counter()
+        for p in data["pods"].get("items", []):
+            status = p.get("status")
+            phases[status.get("phase") if status else None] += 1
+        
+        deployments = Counter()
+        for d in data["deployments"].get("items", []):
+            status = d.get("status") or {}
+            spec = d.get("spec") or {}
+            deployments[status.get("availableReplicas", 0) >= spec.get("replicas", 1)] += 1
+        
+        event_types = Counter(e.get("type") for e in data["events"].get("items", []))
+        
+        return {"nodes": nodes, "pods": phases, "deployments": deployments, "events": event_types}
+    
+    def _fetch_cluster_data(self) -> Dict[str, Dict]:
+        """Run the kubectl state queries concurrently, reusing recent results"""
+        key = (self.context, self.namespace)
+        now = time.monotonic()
+        cached = _cluster_data_cache.get(key)
+        if cached is not None and now - cached[0] < self.state_cache_ttl:
+            return cached[1]
+        
+        import subprocess
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+        
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=len(KUBECTL_STATE_QUERIES))
+        
+        futures = {
+            self._executor.submit(
+                subprocess.run,
+                self._kubectl_prefix + args,
+                capture_output=True,
+                timeout=30,
+            ): name
+            for name, args in KUBECTL_STATE_QUERIES.items()
+        }
+        
+        data = {}
+        for future in as_completed(futures):
+            result = future.result()
+            data[futures[future]] = _load_json(result.stdout) if result.returncode == 0 else {"items": []}
+        
+        _cluster_data_cache[key] = (now, data)
+        return data
     
     def _execute_action(self, action: ClusterAction) -> Dict[str, Any]:
         """Execute a cluster management action"""
@@ -414,32 +961,38 @@ class ClusterEnv(gym.Env):
         """Execute action in simulation"""
         result = {"success": True, "message": f"Executed {action.name}", "data": None}
         
-        if action == ClusterAction.RESTART_FAILED_PODS:
-            if "pod_failure" in self._sim_issues:
-                self._sim_issues.remove("pod_failure")
-                result["message"] = "Restarted failed pods - issue resolved"
-            else:
-                result["message"] = "No failed pods to restart"
-        
-        elif action == ClusterAction.UNCORDON_NODE:
-            if "node_not_ready" in self._sim_issues:
-                self._sim_issues.remove("node_not_ready")
-                result["message"] = "Uncordoned node - issue resolved"
-        
-        elif action == ClusterAction.SCALE_DOWN_DEPLOYMENT:
-            if "resource_pressure" in self._sim_issues:
-                self._sim_issues.remove("resource_pressure")
-                result["message"] = "Scaled down deployment - resource pressure relieved"
+        handler = self._sim_action_table.get(action)
+        if handler is not None:
+            handler(result)
         
         return result
     
+    def _sim_restart_failed_pods(self, result: Dict[str, Any]):
+        """Resolve simulated pod failures"""
+        if self._sim_issues & _POD_FAILURE:
+            self._sim_issues &= ~_POD_FAILURE
+            result["message"] = "Restarted failed pods - issue resolved"
+        else:
+            result["message"] = "No failed pods to restart"
+    
+    def _sim_uncordon_node(self, result: Dict[str, Any]):
+        """Resolve a simulated not-ready node"""
+        if self._sim_issues & _NODE_NOT_READY:
+            self._sim_issues &= ~_NODE_NOT_READY
+            result["message"] = "Uncordoned node - issue resolved"
+    
+    def _sim_scale_down_deployment(self, result: Dict[str, Any]):
+        """Relieve simulated resource pressure"""
+        if self._sim_issues & _RESOURCE_PRESSURE:
+            self._sim_issues &= ~_RESOURCE_PRESSURE
+            result["message"] = "Scaled down deployment - resource pressure relieved"
+    
     def _execute_real_action(self, action: ClusterAction) -> Dict[str, Any]:
         """Execute action on real cluster (read-only for safety)"""
-        result = {"success": False, "message": "", "data": None}
+        import subprocess
         
-        kubectl_prefix = ["kubectl"]
-        if self.context:
-            kubectl_prefix.extend(["--context", self.context])
+        result = {"success": False, "message": "", "data": None}
+        kubectl_prefix = self._kubectl_prefix
         
         try:
             if action == ClusterAction.GET_NODES:
@@ -491,84 +1044,259 @@ class ClusterEnv(gym.Env):
     
     def _calculate_reward(
         self,
-        prev_state: Optional[ClusterState],
-        curr_state: ClusterState,
+        prev_state: Optional[np.ndarray],
+        curr_state: np.ndarray,
         action: int,
         action_result: Dict,
     ) -> float:
         """Calculate reward based on state transition"""
-        reward = 0.0
-        
         if prev_state is None:
             return 0.0
         
-        # Reward for improving cluster health
-        if curr_state.pods_failed < prev_state.pods_failed:
-            reward += 10.0 * (prev_state.pods_failed - curr_state.pods_failed)
-        
-        if curr_state.pods_pending < prev_state.pods_pending:
-            reward += 5.0 * (prev_state.pods_pending - curr_state.pods_pending)
-        
-        if curr_state.nodes_not_ready < prev_state.nodes_not_ready:
-            reward += 20.0 * (prev_state.nodes_not_ready - curr_state.nodes_not_ready)
-        
-        # Penalty for degradation
-        if curr_state.pods_failed > prev_state.pods_failed:
-            reward -= 15.0 * (curr_state.pods_failed - prev_state.pods_failed)
-        
-        if curr_state.nodes_not_ready > prev_state.nodes_not_ready:
-            reward -= 25.0 * (curr_state.nodes_not_ready - prev_state.nodes_not_ready)
-        
-        # Reward for resource optimization
-        if curr_state.cpu_usage_percent < prev_state.cpu_usage_percent and prev_state.cpu_usage_percent > 70:
-            reward += 2.0
-        
-        # Small penalty for each step (encourage efficiency)
-        reward -= 0.1
-        
-        # Bonus for fully healthy cluster
-        if (curr_state.pods_failed == 0 and
-            curr_state.nodes_not_ready == 0 and
-            curr_state.pods_pending == 0):
-            reward += 5.0
-        
-        return reward
+        return float(_reward_kernel(prev_state, curr_state))
     
     def _check_terminated(self) -> bool:
         """Check if episode should terminate"""
-        if self.state is None:
-            return False
-        
-        # Terminate on catastrophic failure
-        if self.state.nodes_ready == 0:
-            return True
-        
-        # Terminate on all issues resolved
-        if (self.state.pods_failed == 0 and
-            self.state.nodes_not_ready == 0 and
-            not self.state.has_pvc_issues and
-            not self.state.has_network_issues and
-            not self.state.has_resource_pressure):
-            return True
-        
-        return False
+        return _episode_done(self._issue_mask)
     
     def _get_current_issues(self) -> List[str]:
         """Get list of current issues"""
         if self.simulation_mode:
-            return list(self._sim_issues)
+            return list(_SIM_ISSUE_NAMES[self._sim_issues])
+        
+        mask = self._issue_mask
+        if not mask:
+            return []
+        
+        s = self.state
+        return [
+            message.format(s[field]) if field else message
+            for bit, field, message in _ISSUE_MESSAGES
+            if mask & bit
+        ]
+
+
+# Issue bit resolved by each simulated remediation action
+_SIM_ACTION_RESOLVES = {
+    int(ClusterAction.RESTART_FAILED_PODS): _POD_FAILURE,
+    int(ClusterAction.UNCORDON_NODE): _NODE_NOT_READY,
+    int(ClusterAction.SCALE_DOWN_DEPLOYMENT): _RESOURCE_PRESSURE,
+}
+
+# Simulated transition tables, built on first use (see _get_sim_tables)
+_sim_transition_tables: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None
+_sim_obs_tables: Dict[np.dtype, np.ndarray] = {}
+
+
+def _get_sim_tables(obs_dtype: np.dtype) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Tables of every simulated outcome, indexed by simulated issue mask.
+
+    Returns ``(keep, rewards, done, obs)``: the issue bits each action
+    leaves in place, the reward of every (previous, current) mask pair,
+    whether each mask ends the episode, and each mask's observation as
+    ``obs_dtype``. All are computed from _SIM_STATES with ClusterEnv's own
+    reward, termination and observation code, so BatchClusterEnv cannot
+    drift from it.
+    """
+    global _sim_transition_tables
+    num_masks = len(_SIM_STATES)
+    if _sim_transition_tables is None:
+        keep = np.full(len(ClusterAction), num_masks - 1, dtype=np.uint8)
+        for action, bit in _SIM_ACTION_RESOLVES.items():
+            keep[action] = (num_masks - 1) & ~bit
+        rewards = np.array([
+            [_reward_kernel(_SIM_STATES[prev, ...], _SIM_STATES[curr, ...]) for curr in range(num_masks)]
+            for prev in range(num_masks)
+        ], dtype=np.float64)
+        done = np.array([_episode_done(mask) for mask in _SIM_STATE_ISSUES])
+        _sim_transition_tables = (keep, rewards, done)
+
+    obs = _sim_obs_tables.get(obs_dtype)
+    if obs is None:
+        kernel = _obs_kernel_uint8 if obs_dtype == np.uint8 else _obs_kernel
+        obs = np.zeros((num_masks, len(OBS_FEATURES)), dtype=obs_dtype)
+        for mask in range(num_masks):
+            kernel(_SIM_STATES[mask, ...], obs[mask])
+        _sim_obs_tables[obs_dtype] = obs
+
+    return _sim_transition_tables + (obs,)
+
+
+@_njit_parallel
+def _batch_step_kernel(
+    sim_issues, actions, autoreset, current_step, max_steps, total_reward,
+    keep_table, reward_table, done_table, obs_table,
+    obs, rewards, terminated, truncated,
+):
+    """Step every environment of a BatchClusterEnv in one pass
+
+    Equivalent to BatchClusterEnv's NumPy step, but runs one environment per
+    loop iteration and splits the batch across cores. Environments flagged
+    in ``autoreset`` must already have been reset by the caller; they ignore
+    their action this step.
+    """
+    for i in _prange(sim_issues.shape[0]):
+        mask = sim_issues[i]
+        if autoreset[i]:
+            reward = 0.0
+            done = False
+            truncated[i] = False
+        else:
+            current_step[i] += 1
+            new_mask = mask & keep_table[actions[i]]
+            reward = reward_table[mask, new_mask]
+            done = done_table[new_mask]
+            truncated[i] = current_step[i] >= max_steps
+            sim_issues[i] = new_mask
+            mask = new_mask
+        rewards[i] = reward
+        total_reward[i] += reward
+        terminated[i] = done
+        autoreset[i] = done or truncated[i]
+        for j in range(obs.shape[1]):
+            obs[i, j] = obs_table[mask, j]
+
+
+class BatchClusterEnv(gym.vector.VectorEnv):
+    """
+    Vectorized Simulated Cluster Environment
+
+    Steps ``num_envs`` simulated clusters in a single call. Each simulated
+    cluster is fully described by its issue mask, so the batch keeps one
+    mask per environment and looks up rewards, terminations and
+    observations in tables precomputed from ClusterEnv's rules (see
+    _get_sim_tables). A batch step is a handful of NumPy operations rather
+    than ``num_envs`` Python-level steps, and matches ClusterEnv exactly.
+    Only simulation mode is supported; use ClusterEnv for real clusters.
+
+    When Numba is installed, each step runs as a single compiled kernel
+    that processes one environment per iteration and spreads the batch
+    across all cores (see _batch_step_kernel).
+    """
+
+    metadata = {'render_modes': [], 'autoreset_mode': gym.vector.AutoresetMode.NEXT_STEP}
+
+    OBS_DIM = ClusterEnv.OBS_DIM
+    NUM_ACTIONS = ClusterEnv.NUM_ACTIONS
+
+    def __init__(self, num_envs: int = 8, max_steps: int = 100, obs_dtype: Any = np.float32):
+        super().__init__()
+
+        obs_dtype = np.dtype(obs_dtype)
+        if obs_dtype not in _OBS_DTYPES:
+            raise ValueError(f"Unsupported obs_dtype: {obs_dtype} (expected float32 or uint8)")
+
+        self.num_envs = num_envs
+        self.max_steps = max_steps
+        self.obs_dtype = obs_dtype
+
+        # Define spaces
+        self.single_observation_space = _observation_box(obs_dtype, self.OBS_DIM)
+        self.single_action_space = spaces.Discrete(self.NUM_ACTIONS)
+        self.observation_space = batch_space(self.single_observation_space, num_envs)
+        self.action_space = batch_space(self.single_action_space, num_envs)
+
+        self._keep_table, self._reward_table, self._done_table, self._obs_table = _get_sim_tables(obs_dtype)
+
+        n = num_envs
+
+        # Episode tracking
+        self.current_step = np.zeros(n, dtype=np.int32)
+        self.total_reward = np.zeros(n, dtype=np.float64)
+        self._autoreset = np.zeros(n, dtype=bool)
+
+        # Simulation state: one mask of Issue bits per environment
+        self._sim_issues = np.zeros(n, dtype=np.uint8)
+        self._prev_sim_issues = np.zeros(n, dtype=np.uint8)
+
+        # Output buffers, written in place every step
+        self._obs_buf = np.zeros((n, self.OBS_DIM), dtype=obs_dtype)
+        self._rew_buf = np.zeros(n, dtype=np.float64)
+        self._term_buf = np.zeros(n, dtype=bool)
+        self._trunc_buf = np.zeros(n, dtype=bool)
+
+    @property
+    def state(self) -> np.ndarray:
+        """Current cluster state of every environment, as STATE_DTYPE records"""
+        return _SIM_STATES[self._sim_issues]
+
+    def reset(
+        self,
+        seed: Optional[int] = None,
+        options: Optional[Dict] = None,
+    ) -> Tuple[np.ndarray, Dict]:
+        """Reset all environments"""
+        super().reset(seed=seed)
+
+        self._reset_simulation(np.ones(self.num_envs, dtype=bool))
+        self._autoreset[:] = False
+        self.to_observation()
+
+        return self._obs_buf, {}
+
+    def step(self, actions: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, Dict]:
+        """Execute one action in every environment"""
+        # The Numba kernel indexes tables with these unchecked
+        actions = np.asarray(actions, dtype=np.intp)
+        if actions.shape != (self.num_envs,):
+            raise ValueError(f"Expected {self.num_envs} actions, got shape {actions.shape}")
+        if actions.size and (actions.min() < 0 or actions.max() >= self.NUM_ACTIONS):
+            raise ValueError(f"Actions must be in [0, {self.NUM_ACTIONS}), got {actions}")
         
-        issues = []
-        if self.state:
-            if self.state.nodes_not_ready > 0:
-                issues.append(f"{self.state.nodes_not_ready} node(s) not ready")
-            if self.state.pods_failed > 0:
-                issues.append(f"{self.state.pods_failed} pod(s) failed")
-            if self.state.pods_pending > 0:
-                issues.append(f"{self.state.pods_pending} pod(s) pending")
-            if self.state.has_resource_pressure:
-                issues.append("Resource pressure detected")
-        return issues
+        if NUMBA_AVAILABLE:
+            if self._autoreset.any():
+                self._reset_simulation(self._autoreset)
+            _batch_step_kernel(
+                self._sim_issues, actions, self._autoreset,
+                self.current_step, self.max_steps, self.total_reward,
+                self._keep_table, self._reward_table, self._done_table, self._obs_table,
+                self._obs_buf, self._rew_buf, self._term_buf, self._trunc_buf,
+            )
+            return self._obs_buf, self._rew_buf, self._term_buf, self._trunc_buf, {}
+
+        # Environments that finished on the previous step are reset and
+        # ignore their action (next-step autoreset)
+        resetting = self._autoreset
+        active = ~resetting
+        if resetting.any():
+            self._reset_simulation(resetting)
+
+        self.current_step += active
+        np.copyto(self._prev_sim_issues, self._sim_issues)
+        self._execute_simulated_action(actions, active)
+
+        # Reward and termination of each (previous, current) mask transition
+        np.copyto(self._rew_buf, self._reward_table[self._prev_sim_issues, self._sim_issues])
+        self._rew_buf[resetting] = 0.0
+        self.total_reward += self._rew_buf
+
+        np.logical_and(self._done_table[self._sim_issues], active, out=self._term_buf)
+        np.greater_equal(self.current_step, self.max_steps, out=self._trunc_buf)
+        self._trunc_buf &= active
+        np.logical_or(self._term_buf, self._trunc_buf, out=self._autoreset)
+
+        self.to_observation()
+
+        return self._obs_buf, self._rew_buf, self._term_buf, self._trunc_buf, {}
+
+    def _reset_simulation(self, mask: np.ndarray):
+        """Reset the masked environments with random issues"""
+        count = int(mask.sum())
+        draws = self.np_random.random((count, len(SIM_ISSUES))) < SIM_ISSUE_PROBS
+        self._sim_issues[mask] = draws @ (1 << np.arange(len(SIM_ISSUES)))
+        self.current_step[mask] = 0
+        self.total_reward[mask] = 0.0
+
+    def _execute_simulated_action(self, actions: np.ndarray, active: np.ndarray):
+        """Apply remediation actions to the active environments"""
+        keep = self._keep_table[actions]
+        keep[~active] = len(_SIM_STATES) - 1
+        self._sim_issues &= keep
+
+    def to_observation(self):
+        """Write the observation batch into the observation buffer"""
+        np.take(self._obs_table, self._sim_issues, axis=0, out=self._obs_buf)
 
 
 def env_creator(name: str = "cluster"):
@@ -581,12 +1309,56 @@ def make(name: str = "cluster", simulation_mode: bool = True, buf=None, **kwargs
     """Create a ClusterEnv wrapped for PufferLib"""
     env = ClusterEnv(simulation_mode=simulation_mode, **kwargs)
     
-    if PUFFERLIB_AVAILABLE:
-        return pufferlib.emulation.GymnasiumPufferEnv(env=env, buf=buf)
+    emulation = _get_pufferlib_emulation()
+    if emulation:
+        return emulation.GymnasiumPufferEnv(env=env, buf=buf)
     else:
         return env
 
 
+def env_creator_sync(name: str = "cluster"):
+    """Creator for several ClusterEnvs behind a Gymnasium vector env"""
+    import functools
+    return functools.partial(make_vec, name)
+
+
+def make_vec(
+    name: str = "cluster",
+    num_envs: int = 4,
+    vectorization_mode: str = "sync",
+    **kwargs,
+) -> gym.vector.VectorEnv:
+    """Create ``num_envs`` ClusterEnvs behind a Gymnasium vector env
+    
+    Defaults to SyncVectorEnv. A ClusterEnv step is far cheaper than the
+    inter-process round trip AsyncVectorEnv adds, so ``"async"`` only pays
+    off for real-cluster envs, whose steps wait on the API server. Async
+    workers write observations into shared memory. Both copy each
+    observation out of the env, so the envs return their buffers uncopied
+    unless ``copy_obs`` is given.
+    """
+    import functools
+    kwargs.setdefault("copy_obs", False)
+    env_fns = [functools.partial(ClusterEnv, **kwargs)] * num_envs
+    
+    if vectorization_mode == "async":
+        return gym.vector.AsyncVectorEnv(env_fns, shared_memory=True)
+    if vectorization_mode == "sync":
+        return gym.vector.SyncVectorEnv(env_fns)
+    raise ValueError(f"Unknown vectorization_mode: {vectorization_mode!r} (expected 'sync' or 'async')")
+
+
+def batch_env_creator(name: str = "cluster"):
+    """Creator for the vectorized simulated environment (a Gymnasium VectorEnv)"""
+    import functools
+    return functools.partial(make_batch, name)
+
+
+def make_batch(name: str = "cluster", num_envs: int = 8, **kwargs) -> BatchClusterEnv:
+    """Create a vectorized simulated ClusterEnv batch"""
+    return BatchClusterEnv(num_envs=num_envs, **kwargs)
+
+
 if __name__ == "__main__":
     # Test the environment
     env = ClusterEnv(simulation_mode=True)
@@ -82,6 +82,8 @@ async function installPufferLib(
   await runCommand(pythonPath, ['-m', 'pip', 'install', 
     'numpy',
     'gymnasium',
+    'numba',
+    'kubernetes',
     'tensorboard',
   ], verbose);
   
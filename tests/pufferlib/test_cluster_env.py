@@ -0,0 +1,293 @@
+"""Tests for the PufferLib cluster environment (src/pufferlib/environments)"""
+
+import copy
+import os
+import sys
+import time
+from types import ModuleType, SimpleNamespace as NS
+
+import gymnasium as gym
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src", "pufferlib", "environments"))
+
+import cluster_env  # noqa: E402
+from cluster_env import BatchClusterEnv, ClusterAction, ClusterEnv  # noqa: E402
+
+
+def test_check_env():
+    from gymnasium.utils.env_checker import check_env
+
+    check_env(ClusterEnv(), skip_render_check=True)
+    check_env(ClusterEnv(obs_dtype=np.uint8), skip_render_check=True)
+
+
+def test_observations_are_copied_unless_disabled():
+    env = ClusterEnv()
+    obs, _ = env.reset(seed=0)
+    first = obs.copy()
+    next_obs = env.step(ClusterAction.RESTART_FAILED_PODS)[0]
+    assert next_obs is not obs
+    assert np.array_equal(obs, first)
+
+    env = ClusterEnv(copy_obs=False)
+    obs, _ = env.reset(seed=0)
+    assert env.step(ClusterAction.WAIT)[0] is obs
+
+
+def test_make_vec_observations():
+    envs = cluster_env.make_vec(num_envs=2)
+    obs, _ = envs.reset(seed=0)
+    next_obs = envs.step(np.array([ClusterAction.WAIT] * 2))[0]
+    assert obs.shape == next_obs.shape == (2, ClusterEnv.OBS_DIM)
+    assert not np.shares_memory(obs, envs.envs[0].unwrapped._obs_buf)
+    envs.close()
+
+
+@pytest.mark.parametrize("info_mode", ["full", "minimal", "none"])
+def test_record_episode_statistics_over_several_episodes(info_mode):
+    env = gym.wrappers.RecordEpisodeStatistics(ClusterEnv(max_steps=3, info_mode=info_mode))
+    env.reset(seed=0)
+
+    episodes = 0
+    for _ in range(20):
+        _, _, terminated, truncated, info = env.step(ClusterAction.WAIT)
+        if terminated or truncated:
+            episodes += 1
+            assert "episode" in info
+            env.reset()
+        else:
+            assert "episode" not in info
+
+    assert episodes > 1
+
+
+def test_info_contents_by_mode():
+    _, info = ClusterEnv(info_mode="full").reset(seed=0)
+    assert set(info) == {"step", "issues"}
+
+    env = ClusterEnv(info_mode="minimal")
+    env.reset(seed=0)
+    _, _, _, _, info = env.step(ClusterAction.WAIT)
+    assert set(info) == {"step", "action", "action_result", "total_reward"}
+
+    env = ClusterEnv(info_mode="none")
+    env.reset(seed=0)
+    assert env.step(ClusterAction.WAIT)[4] == {}
+
+    with pytest.raises(ValueError):
+        ClusterEnv(info_mode="verbose")
+
+
+def test_full_info_is_new_on_every_call():
+    env = ClusterEnv(info_mode="full")
+    _, reset_info = env.reset(seed=0)
+    first = env.step(ClusterAction.WAIT)[4]
+    second = env.step(ClusterAction.RESTART_FAILED_PODS)[4]
+    assert first is not second and first is not reset_info
+    assert first["action"] == "WAIT" and second["action"] == "RESTART_FAILED_PODS"
+
+    env = ClusterEnv(info_mode="minimal")
+    env.reset(seed=0)
+    assert env.step(ClusterAction.WAIT)[4] is env.step(ClusterAction.WAIT)[4]
+
+
+def _start_from(env, mask):
+    """Reset ``env`` and put its simulation in the issue ``mask``"""
+    env.reset(seed=0)
+    env._sim_issues = int(mask)
+    env._get_cluster_state(env.state)
+    env._obs_kernel(env.state, env._obs_buf)
+    return env._obs_buf
+
+
+@pytest.mark.parametrize("use_numba", [True, False], ids=["numba", "numpy"])
+def test_batch_env_matches_single_envs(monkeypatch, use_numba):
+    if use_numba and not cluster_env.NUMBA_AVAILABLE:
+        pytest.skip("numba is not installed")
+    monkeypatch.setattr(cluster_env, "NUMBA_AVAILABLE", use_numba)
+
+    num_envs = 32
+    batch = BatchClusterEnv(num_envs=num_envs, max_steps=10)
+    batch_obs, _ = batch.reset(seed=0)
+
+    # Start one ClusterEnv from each batch environment's simulated issues
+    singles = [ClusterEnv(max_steps=10) for _ in range(num_envs)]
+    for i, env in enumerate(singles):
+        assert np.array_equal(_start_from(env, batch._sim_issues[i]), batch_obs[i])
+
+    rng = np.random.default_rng(0)
+    finished = np.zeros(num_envs, dtype=bool)
+    autoresets = 0
+    for _ in range(30):
+        actions = rng.integers(0, ClusterEnv.NUM_ACTIONS, num_envs)
+
+        # Environments that finished last step draw fresh issues from the
+        # batch's generator, in order, and ignore their action
+        draws = copy.deepcopy(batch.np_random).random((int(finished.sum()), len(cluster_env.SIM_ISSUES)))
+        fresh = (draws < cluster_env.SIM_ISSUE_PROBS) @ (1 << np.arange(len(cluster_env.SIM_ISSUES)))
+
+        batch_obs, rewards, terminated, truncated, _ = batch.step(actions)
+        assert rewards.dtype == np.float64
+        assert np.array_equal(batch._sim_issues[finished], fresh)
+        for i, env in enumerate(singles):
+            if finished[i]:
+                assert rewards[i] == 0.0
+                assert not terminated[i] and not truncated[i]
+                assert batch.current_step[i] == 0
+                assert np.array_equal(_start_from(env, batch._sim_issues[i]), batch_obs[i])
+                autoresets += 1
+                continue
+            obs, reward, done, cut, _ = env.step(actions[i])
+            assert np.array_equal(obs, batch_obs[i])
+            assert reward == rewards[i].item()
+            assert env.total_reward == batch.total_reward[i]
+            assert (done, cut) == (terminated[i], truncated[i])
+        finished = terminated | truncated
+    assert autoresets > 0
+
+
+@pytest.mark.parametrize("actions", [[6], [6] * 5, [99] * 4, [-1, 0, 0, 0], [[0, 0, 0, 0]]])
+def test_batch_env_rejects_bad_actions(actions):
+    batch = BatchClusterEnv(num_envs=4)
+    batch.reset(seed=0)
+    with pytest.raises(ValueError):
+        batch.step(np.array(actions))
+
+
+def test_uint8_observations_match_between_envs_for_every_mask():
+    masks = np.arange(32, dtype=np.uint8)
+    batch = BatchClusterEnv(num_envs=len(masks), obs_dtype=np.uint8)
+    batch.reset(seed=0)
+    batch._sim_issues[:] = masks
+    batch.to_observation()
+    batch_obs = batch._obs_buf
+
+    env = ClusterEnv(obs_dtype=np.uint8)
+    env.reset(seed=0)
+    for mask in masks:
+        env._sim_issues = int(mask)
+        env._get_cluster_state(env.state)
+        env._obs_kernel(env.state, env._obs_buf)
+        assert env.observation_space.contains(env._obs_buf)
+        assert np.array_equal(env._obs_buf, batch_obs[mask]), mask
+
+    # Features are stored as round(x * 255): 45 of 50 pods running is 0.9 -> 230
+    assert batch_obs[int(cluster_env.Issue.POD_FAILURE), 4] == 230
+
+
+class _Forbidden(Exception):
+    pass
+
+
+def _fake_kubernetes(monkeypatch, forbidden=(), forbidden_watch=()):
+    """Install a fake kubernetes package
+
+    Listings of ``forbidden`` kinds and watches of ``forbidden_watch``
+    kinds fail. Returns the number of listings made of each kind.
+    """
+    calls = {"nodes": 0, "events": 0}
+
+    def listing(*items):
+        return NS(items=list(items), metadata=NS(resource_version="1"))
+
+    def node(uid, ready):
+        return NS(metadata=NS(uid=uid), status=NS(conditions=[NS(type="Ready", status=str(ready))]))
+
+    def pod(uid, phase):
+        return NS(metadata=NS(uid=uid), status=NS(phase=phase))
+
+    class CoreV1Api:
+        def __init__(self, api_client):
+            pass
+
+        def list_node(self, **kwargs):
+            calls["nodes"] += 1
+            return listing(node("n1", True), node("n2", False))
+
+        def list_pod_for_all_namespaces(self, **kwargs):
+            return listing(pod("p1", "Running"), pod("p2", "Failed"))
+
+        def list_event_for_all_namespaces(self, **kwargs):
+            calls["events"] += 1
+            if "events" in forbidden:
+                raise _Forbidden("403 Forbidden")
+            return listing(NS(metadata=NS(uid="e1"), type="Warning"))
+
+    class AppsV1Api:
+        def __init__(self, api_client):
+            pass
+
+        def list_deployment_for_all_namespaces(self, **kwargs):
+            return listing(NS(metadata=NS(uid="d1"), status=NS(available_replicas=1), spec=NS(replicas=1)))
+
+    class Watch:
+        def stream(self, list_fn, **kwargs):
+            if list_fn.__name__ == "list_node" and "nodes" in forbidden_watch:
+                raise _Forbidden("403 Forbidden")
+            # An idle watch that never delivers an event
+            time.sleep(3600)
+            yield
+
+    kubernetes = ModuleType("kubernetes")
+    kubernetes.client = NS(CoreV1Api=CoreV1Api, AppsV1Api=AppsV1Api)
+    kubernetes.config = NS(new_client_from_config=lambda context=None: None)
+    kubernetes.watch = NS(Watch=Watch)
+    monkeypatch.setitem(sys.modules, "kubernetes", kubernetes)
+    return calls
+
+
+def test_watcher_treats_forbidden_kind_as_empty(monkeypatch):
+    calls = _fake_kubernetes(monkeypatch, forbidden=("events",))
+    monkeypatch.setattr(cluster_env._ClusterWatcher, "RELIST_BACKOFF", 0.05)
+    env = ClusterEnv(context="forbidden-events", simulation_mode=False)
+    try:
+        start = time.monotonic()
+        env.reset()
+        assert time.monotonic() - start < 5.0
+        assert env.use_kubernetes_client
+        assert env.state["num_nodes"] == 2 and env.state["nodes_ready"] == 1
+        assert env.state["num_pods"] == 2 and env.state["pods_failed"] == 1
+        assert env.state["recent_events_warning"] == 0
+
+        # Relisting the forbidden kind backs off: 0.05 + 0.1 + 0.2 + 0.4 s
+        time.sleep(0.7)
+        assert calls["events"] <= 5
+    finally:
+        env.close()
+    assert "forbidden-events" not in cluster_env._cluster_watchers
+
+
+def test_watcher_backs_off_when_only_the_watch_fails(monkeypatch):
+    calls = _fake_kubernetes(monkeypatch, forbidden_watch=("nodes",))
+    monkeypatch.setattr(cluster_env._ClusterWatcher, "RELIST_BACKOFF", 0.05)
+    env = ClusterEnv(context="forbidden-node-watch", simulation_mode=False)
+    try:
+        env.reset()
+        assert env.state["num_nodes"] == 2
+
+        # Listing succeeds every time, yet relisting still backs off
+        time.sleep(0.7)
+        assert calls["nodes"] <= 5
+    finally:
+        env.close()
+
+
+def test_watcher_sync_timeout_falls_back_to_kubectl(monkeypatch):
+    _fake_kubernetes(monkeypatch)
+    monkeypatch.setattr(cluster_env._ClusterWatcher, "SYNC_TIMEOUT", 0.0)
+    monkeypatch.setattr(cluster_env._ClusterWatcher, "_follow", lambda self, *args: None)
+    monkeypatch.setattr(ClusterEnv, "_fetch_cluster_data", lambda self: {
+        "nodes": {"items": [{"status": {"conditions": [{"type": "Ready", "status": "True"}]}}]},
+        "pods": {"items": []},
+        "deployments": {"items": []},
+        "events": {"items": []},
+    })
+
+    env = ClusterEnv(context="never-synced", simulation_mode=False)
+    env.reset()
+    assert not env.use_kubernetes_client
+    assert env._watcher is None
+    assert env.state["num_nodes"] == 1 and env.state["nodes_ready"] == 1
+    assert "never-synced" not in cluster_env._cluster_watchers